@@ -2,13 +2,166 @@ import json
 import sys
 import argparse
 from pathlib import Path
-from typing import Dict, List, Tuple, Any
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Set,
+    Tuple,
+    Union,
+)
 import os
+from itertools import repeat
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
+from functools import lru_cache
+
+_json_loads: Callable[[bytes], Any]
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, fall back to the standard library
+    _json_loads = json.loads
+
+# Attributes holding a file path, both in documents and in their
+# associated video lectures
+PATH_ATTRIBUTES: Final = ("path", "srt_path", "pdf_page_video_ts_path")
+
+# Document attributes whose distinct values are listed in the metadata summary
+SUMMARY_KEYS: Final = ("type", "subtype", "model", "processing_method")
+
+# Allowed values, in the order they are listed in error messages
+VALID_MODELS: Final = ("gemini-2.5-flash", "gemini-2.5-pro")
+VALID_PROCESSING_METHODS: Final = ("gemini", "tesseract", "google")
+
+# Rules on a single document field, checked in this order when the field is
+# present and not null: (field, check, error message). The message is
+# formatted with the offending {value} and the name of its {type}.
+FIELD_RULES: Final[Tuple[Tuple[str, Callable[[Any], bool], str], ...]] = (
+    (
+        "week",
+        lambda v: isinstance(v, int),
+        "must be an integer or null, got: {type}",
+    ),
+    (
+        "number",
+        lambda v: type(v) is str,
+        "must be a string or null, got: {type}",
+    ),
+    (
+        "sub_number",
+        lambda v: type(v) is str,
+        "must be a string or null, got: {type}",
+    ),
+    (
+        "model",
+        lambda v: v in VALID_MODELS,
+        "must be one of " + str(list(VALID_MODELS)) + " or null, got: {value}",
+    ),
+    (
+        "from",
+        lambda v: type(v) is str and _is_ddmmyyyy(v),
+        "must be a string in format 'DD/MM/YYYY' or null (and a real date)",
+    ),
+    (
+        "until",
+        lambda v: type(v) is str and _is_ddmmyyyy(v),
+        "must be a string in format 'DD/MM/YYYY' or null (and a real date)",
+    ),
+    (
+        "tikz",
+        lambda v: v is False,
+        "must be false or null, got: {value}",
+    ),
+    (
+        "title",
+        lambda v: "_" not in str(v),
+        "cannot contain underscore characters",
+    ),
+    (
+        "processing_method",
+        lambda v: v in VALID_PROCESSING_METHODS,
+        "must be one of "
+        + str(list(VALID_PROCESSING_METHODS))
+        + " or null, got: {value}",
+    ),
+    (
+        "srt_path",
+        lambda v: type(v) is str and v.endswith(".srt"),
+        "must be null or end with '.srt'",
+    ),
+)
+
+# Fields every associated video lecture must have, in reporting order
+VIDEO_LECTURE_REQUIRED_FIELDS: Final = (
+    "title",
+    "is_gemini_processed_video",
+    "original_link",
+    "path",
+    "srt_path",
+    "pdf_page_video_ts_path",
+)
+
+# Fields required in a Gemini video JSON file and in each of its segments
+GEMINI_REQUIRED_FIELDS: Final = frozenset(
+    {
+        "language",
+        "general_description_en",
+        "video_keywords_en",
+        "video_keywords_fr",
+        "video_segments",
+    }
+)
+GEMINI_SEGMENT_REQUIRED_FIELDS: Final = frozenset(
+    {
+        "start_time",
+        "end_time",
+        "key_frame_time",
+        "contains_math",
+        "contains_diagram",
+        "teacher_uses_pointer",
+        "segment_audio_transcription_en",
+        "segment_audio_transcription_fr",
+        "extracted_text_video_frame",
+        "short_description_video_segment_en",
+        "short_description_video_segment_fr",
+        "segment_keywords_en",
+        "segment_keywords_fr",
+    }
+)
+
+
+class MetadataFileError(Exception):
+    """
+    A metadata file could not be validated; the message is reported by the
+    main process, which then exits.
+    """
 
 
 def _is_ddmmyyyy(s: str) -> bool:
+    # Fast path for the zero-padded form used in the metadata; strptime also
+    # accepts unpadded days and months, so anything else still goes through it
+    if (
+        len(s) == 10
+        and s.isascii()
+        and s[2] == "/"
+        and s[5] == "/"
+        and s[:2].isdecimal()
+        and s[3:5].isdecimal()
+        and s[6:].isdecimal()
+    ):
+        try:
+            datetime(int(s[6:]), int(s[3:5]), int(s[:2]))
+            return True
+        except ValueError:
+            return False
     try:
         datetime.strptime(s, "%d/%m/%Y")
         return True
@@ -16,76 +169,113 @@ def _is_ddmmyyyy(s: str) -> bool:
         return False
 
 
-def list_non_hidden_files(root_folder: Path) -> List[str]:
+def list_non_hidden_files(
+    root_folder: Path, exclude_dirs: Collection[str] = ()
+) -> List[str]:
     """
     Recursively list all non-hidden files under root_folder,
     returning their paths relative to root_folder as strings.
+    Hidden directories, and the top-level directories named in exclude_dirs,
+    are skipped without being descended into; so are unreadable directories.
     """
     all_files = []
-    for path in root_folder.rglob("*"):
-        if path.is_file():
-            # skip hidden files or those in hidden dirs
-            rel_parts = path.relative_to(root_folder).parts
-            if any(part.startswith(".") for part in rel_parts):
-                continue
-            all_files.append(str(path.relative_to(root_folder)))
+    # (relative prefix, directory) pairs still to be listed
+    stack = [("", os.fspath(root_folder))]
+    while stack:
+        rel_prefix, folder = stack.pop()
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    # skip hidden files or hidden dirs
+                    if entry.name.startswith("."):
+                        continue
+                    # DirEntry type checks use the d_type from the listing,
+                    # so regular files and directories need no extra stat
+                    if entry.is_dir(follow_symlinks=False):
+                        if not rel_prefix and entry.name in exclude_dirs:
+                            continue
+                        stack.append((f"{rel_prefix}{entry.name}/", entry.path))
+                    elif entry.is_file():
+                        all_files.append(f"{rel_prefix}{entry.name}")
+        except PermissionError:
+            # unreadable directories are skipped, as Path.rglob does
+            continue
 
     return all_files
 
 
-def validate_gemini_json_structure(json_path: Path) -> bool:
-    """Validate that a Gemini JSON file has the correct structure."""
+def path_exists_in_tree(
+    path_value: str, root_folder: Path, all_files_set: Set[str]
+) -> bool:
+    """
+    Check that path_value names an entry under root_folder, case-sensitively.
+    all_files_set is the fast path; on a miss (hidden files, files behind a
+    symlinked directory, non-normalized paths, directories) the parent
+    directory is listed to look for the exact name.
+    """
+    if type(path_value) is not str:
+        return False
+    if path_value in all_files_set:
+        return True
+    full_path = root_folder / path_value
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        return full_path.name in os.listdir(full_path.parent)
+    except OSError:
+        return False
 
-        required_fields = [
-            "language",
-            "general_description_en",
-            "video_keywords_en",
-            "video_keywords_fr",
-            "video_segments",
-        ]
+
+def file_exists_in_tree(
+    path_value: str, root_folder: Path, all_files_set: Set[str]
+) -> bool:
+    """
+    Check that path_value is a file under root_folder.
+    all_files_set is the fast path; on a miss (hidden files, files behind a
+    symlinked directory, non-normalized paths) the file is looked up on disk.
+    """
+    if type(path_value) is not str:
+        return False
+    return path_value in all_files_set or os.path.isfile(
+        os.path.join(root_folder, path_value)
+    )
+
+
+@lru_cache(maxsize=None)
+def validate_gemini_json_structure(json_path: Union[str, Path]) -> bool:
+    """
+    Validate that a Gemini JSON file has the correct structure.
+    Results are cached per path, as files do not change during a run.
+    """
+    try:
+        with open(json_path, "rb") as f:
+            data = _json_loads(f.read())
 
         # Check top-level required fields
-        for field in required_fields:
-            if field not in data:
-                return False
+        if not GEMINI_REQUIRED_FIELDS <= data.keys():
+            return False
 
         # Check video_segments structure
         if not isinstance(data["video_segments"], list):
             return False
 
         for segment in data["video_segments"]:
-            segment_required_fields = [
-                "start_time",
-                "end_time",
-                "key_frame_time",
-                "contains_math",
-                "contains_diagram",
-                "teacher_uses_pointer",
-                "segment_audio_transcription_en",
-                "segment_audio_transcription_fr",
-                "extracted_text_video_frame",
-                "short_description_video_segment_en",
-                "short_description_video_segment_fr",
-                "segment_keywords_en",
-                "segment_keywords_fr",
-            ]
-            for field in segment_required_fields:
-                if field not in segment:
-                    return False
+            if not GEMINI_SEGMENT_REQUIRED_FIELDS <= segment.keys():
+                return False
 
         return True
     except:
         return False
 
 
-def validate_pdf_timestamp_json_structure(json_path: Path) -> bool:
-    """Validate that a PDF timestamp JSON file has the correct structure."""
+@lru_cache(maxsize=None)
+def validate_pdf_timestamp_json_structure(json_path: Union[str, Path]) -> bool:
+    """
+    Validate that a PDF timestamp JSON file has the correct structure.
+    Results are cached per path: the same mapping is often shared by the
+    video lectures of several documents.
+    """
     try:
-        with open(json_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(json_path, "rb") as f:
+            data = _json_loads(f.read())
 
         if not isinstance(data, list):
             return False
@@ -112,70 +302,65 @@ def validate_pdf_timestamp_json_structure(json_path: Path) -> bool:
 
 
 def validate_associated_video_lecture(
-    video: Dict[str, Any], doc_id: int, index: int, root_folder: Path
+    video: Dict[str, Any],
+    doc_id: int,
+    index: int,
+    root_folder: Path,
+    all_files_set: Set[str],
 ) -> List[Tuple[str, str, int]]:
-    """Validate a single associated video lecture."""
+    """
+    Validate a single associated video lecture.
+    File existence is checked with file_exists_in_tree.
+    """
     errors = []
     prefix = f"associated_video_lectures[{index}]"
 
     # Check required fields exist
-    required_fields = [
-        "title",
-        "is_gemini_processed_video",
-        "original_link",
-        "path",
-        "srt_path",
-        "pdf_page_video_ts_path",
-    ]
-    for field in required_fields:
+    for field in VIDEO_LECTURE_REQUIRED_FIELDS:
         if field not in video:
             errors.append((f"{prefix}.{field}", "required field missing", doc_id))
 
     # Validate title doesn't contain "_"
-    if "title" in video and video["title"] is not None and "_" in str(video["title"]):
+    title = video.get("title")
+    if title is not None and "_" in str(title):
         errors.append(
             (f"{prefix}.title", "cannot contain underscore characters", doc_id)
         )
 
     # Validate original_link contains "mediaspace" if not null
-    if "original_link" in video and video["original_link"] is not None:
-        if (
-            not isinstance(video["original_link"], str)
-            or "mediaspace" not in video["original_link"]
-        ):
-            errors.append(
-                (
-                    f"{prefix}.original_link",
-                    "must be null or contain 'mediaspace'",
-                    doc_id,
-                )
+    original_link = video.get("original_link")
+    if original_link is not None and (
+        type(original_link) is not str or "mediaspace" not in original_link
+    ):
+        errors.append(
+            (
+                f"{prefix}.original_link",
+                "must be null or contain 'mediaspace'",
+                doc_id,
             )
+        )
 
     # Validate srt_path ends in .srt and exists if not null
-    if "srt_path" in video and video["srt_path"] is not None:
-        if not isinstance(video["srt_path"], str) or not video["srt_path"].endswith(
-            ".srt"
-        ):
+    srt_path = video.get("srt_path")
+    if srt_path is not None:
+        if type(srt_path) is not str or not srt_path.endswith(".srt"):
             errors.append(
                 (f"{prefix}.srt_path", "must be null or end with '.srt'", doc_id)
             )
-        else:
-            # Check if file exists
-            srt_full_path = root_folder / video["srt_path"]
-            if not srt_full_path.exists() or not srt_full_path.is_file():
-                errors.append((f"{prefix}.srt_path", "file does not exist", doc_id))
+        # Check if file exists
+        elif not file_exists_in_tree(srt_path, root_folder, all_files_set):
+            errors.append((f"{prefix}.srt_path", "file does not exist", doc_id))
 
     # Validate pdf_page_video_ts_path exists and has correct structure if not null
-    if (
-        "pdf_page_video_ts_path" in video
-        and video["pdf_page_video_ts_path"] is not None
-    ):
-        ts_full_path = root_folder / video["pdf_page_video_ts_path"]
-        if not ts_full_path.exists() or not ts_full_path.is_file():
+    ts_path = video.get("pdf_page_video_ts_path")
+    if ts_path is not None:
+        if not file_exists_in_tree(ts_path, root_folder, all_files_set):
             errors.append(
                 (f"{prefix}.pdf_page_video_ts_path", "file does not exist", doc_id)
             )
-        elif not validate_pdf_timestamp_json_structure(ts_full_path):
+        elif not validate_pdf_timestamp_json_structure(
+            os.path.join(root_folder, ts_path)
+        ):
             errors.append(
                 (f"{prefix}.pdf_page_video_ts_path", "invalid JSON structure", doc_id)
             )
@@ -183,124 +368,64 @@ def validate_associated_video_lecture(
     return errors
 
 
-def extract_paths_from_document(doc: Dict[str, Any]) -> List[Tuple[str, str, int]]:
+def process_document(
+    doc: Dict[str, Any], root_folder: Path, all_files_set: Set[str]
+) -> Tuple[List[Tuple[str, str, int]], List[Tuple[str, str, int]]]:
     """
-    Extract all path attributes from a document.
-    Returns list of tuples: (attribute_name, path_value, document_id)
+    Validate document field values according to business rules, and collect
+    the document's path attributes (including those of its associated video
+    lectures) in the same pass.
+    File existence is checked with file_exists_in_tree.
+    Returns (paths, errors), lists of tuples:
+    (attribute_name, path_value, document_id) and
+    (field_name, error_message, document_id)
     """
     paths = []
-    doc_id = doc.get("id", "unknown")
-
-    # Check main document paths
-    path_attributes = ["path", "srt_path", "pdf_page_video_ts_path"]
-
-    for attr in path_attributes:
-        if attr in doc and doc[attr] is not None:
-            paths.append((attr, doc[attr], doc_id))
-
-    # Check associated video lectures
-    if (
-        "associated_video_lectures" in doc
-        and doc["associated_video_lectures"] is not None
-    ):
-        for i, video in enumerate(doc["associated_video_lectures"]):
-            video_path_attrs = ["path", "srt_path", "pdf_page_video_ts_path"]
-            for attr in video_path_attrs:
-                if attr in video and video[attr] is not None:
-                    paths.append(
-                        (f"associated_video_lectures[{i}].{attr}", video[attr], doc_id)
-                    )
-
-    return paths
-
-
-def validate_document_fields(
-    doc: Dict[str, Any], root_folder: Path
-) -> List[Tuple[str, str, int]]:
-    """
-    Validate document field values according to business rules.
-    Returns list of tuples: (field_name, error_message, document_id)
-    """
     errors = []
     doc_id = doc.get("id", "unknown")
 
-    # "week" has to be an int or null
-    if "week" in doc and doc["week"] is not None:
-        if not isinstance(doc["week"], int):
+    # Collect main document paths
+    for attr in PATH_ATTRIBUTES:
+        value = doc.get(attr)
+        if value is not None:
+            paths.append((attr, value, doc_id))
+
+    # Single-field rules, see FIELD_RULES
+    for field, check, message in FIELD_RULES:
+        value = doc.get(field)
+        if value is not None and not check(value):
             errors.append(
                 (
-                    "week",
-                    f"must be an integer or null, got: {type(doc['week']).__name__}",
+                    field,
+                    message.format(value=value, type=type(value).__name__),
                     doc_id,
                 )
             )
 
-    # "number" and "sub_number" has to be a string or null
-    for field in ["number", "sub_number"]:
-        if field in doc and doc[field] is not None:
-            if not isinstance(doc[field], str):
-                errors.append(
-                    (
-                        field,
-                        f"must be a string or null, got: {type(doc[field]).__name__}",
-                        doc_id,
-                    )
-                )
+    subtype = doc.get("subtype")
+    path = doc.get("path")
 
-    # "model" has to be "gemini-2.5-flash", "gemini-2.5-pro" or null
-    if "model" in doc and doc["model"] is not None:
-        valid_models = ["gemini-2.5-flash", "gemini-2.5-pro"]
-        if doc["model"] not in valid_models:
+    # when "subtype" is "video_lecture", "path" must end in "json" and "is_video" must be true
+    if subtype == "video_lecture" and not doc.get("is_qa"):  # new
+        if path is not None and not path.endswith(".json"):
             errors.append(
                 (
-                    "model",
-                    f"must be one of {valid_models} or null, got: {doc['model']}",
+                    "path",
+                    "must end with '.json' when subtype is 'video_lecture'",
                     doc_id,
                 )
             )
-
-    # when "subtype" is "video_lecture", "path" must end in "json" and "is_video" must be true
-    if doc.get("subtype") == "video_lecture" and not doc.get("is_qa"):  # new
-        if "path" in doc and doc["path"] is not None:
-            if not doc["path"].endswith(".json"):
-                errors.append(
-                    (
-                        "path",
-                        "must end with '.json' when subtype is 'video_lecture'",
-                        doc_id,
-                    )
-                )
-        if "is_video" in doc and doc["is_video"] is not True:
+        # a missing "is_video" is not reported here
+        if doc.get("is_video", True) is not True:
             errors.append(
                 ("is_video", "must be true when subtype is 'video_lecture'", doc_id)
             )
 
-    # "from" and "until" has to be a string in format "09/09/2025" or null
-    for field in ["from", "until"]:
-        if field in doc and doc[field] is not None:
-            val = doc[field]
-            if not isinstance(val, str) or not _is_ddmmyyyy(val):
-                errors.append(
-                    (
-                        field,
-                        "must be a string in format 'DD/MM/YYYY' or null (and a real date)",
-                        doc_id,
-                    )
-                )
-
-    # "tikz" has to be false or null
-    if "tikz" in doc and doc["tikz"] is not None and doc["tikz"] is not False:
-        errors.append(("tikz", f"must be false or null, got: {doc['tikz']}", doc_id))
-
-    # "title" can't have "_" characters
-    if "title" in doc and doc["title"] is not None:
-        if "_" in str(doc["title"]):
-            errors.append(("title", "cannot contain underscore characters", doc_id))
-
     # if "subtype" is "book_in_bibliography" then "one_chunk_per_page" and "one_chunk_per_doc" has to be false
-    if doc.get("subtype") == "book_in_bibliography":
-        for field in ["one_chunk_per_page", "one_chunk_per_doc"]:
-            if field in doc and doc[field] is not False:
+    if subtype == "book_in_bibliography":
+        for field in ("one_chunk_per_page", "one_chunk_per_doc"):
+            # a missing field is not reported here
+            if doc.get(field, False) is not False:
                 errors.append(
                     (
                         field,
@@ -309,35 +434,18 @@ def validate_document_fields(
                     )
                 )
 
-    # "processing_method" has to be "gemini", "tesseract", "google" or null
-    if "processing_method" in doc and doc["processing_method"] is not None:
-        valid_methods = ["gemini", "tesseract", "google"]
-        if doc["processing_method"] not in valid_methods:
-            errors.append(
-                (
-                    "processing_method",
-                    f"must be one of {valid_methods} or null, got: {doc['processing_method']}",
-                    doc_id,
-                )
-            )
-
-    # "srt_path" has to be null or be a string that ends in ".srt"
-    if "srt_path" in doc and doc["srt_path"] is not None:
-        if not isinstance(doc["srt_path"], str) or not doc["srt_path"].endswith(".srt"):
-            errors.append(("srt_path", "must be null or end with '.srt'", doc_id))
-
     # "original_link" rules
-    if "original_link" in doc and doc["original_link"] is not None:
-        val = doc["original_link"]
-        if not isinstance(val, str):
+    original_link = doc.get("original_link")
+    if original_link is not None:
+        if type(original_link) is not str:
             errors.append(("original_link", "must be a string", doc_id))
         else:
             # Platform constraint only applies to videos
             if doc.get("is_video") and (
-                "mediaspace" not in val
-                and "coursera" not in val
-                and "courseware" not in val
-                and "edx" not in val
+                "mediaspace" not in original_link
+                and "coursera" not in original_link
+                and "courseware" not in original_link
+                and "edx" not in original_link
             ):
                 errors.append(
                     (
@@ -347,9 +455,9 @@ def validate_document_fields(
                     )
                 )
             # Applies to all: if it contains ".pdf", it must end exactly at ".pdf"
-            if ".pdf" in val:
-                pdf_pos = val.find(".pdf")
-                if pdf_pos != len(val) - 4:
+            if ".pdf" in original_link:
+                pdf_pos = original_link.find(".pdf")
+                if pdf_pos != len(original_link) - 4:
                     errors.append(
                         (
                             "original_link",
@@ -370,23 +478,20 @@ def validate_document_fields(
             )
 
         # if "is_gemini_processed_video" is true, validate JSON structure
-        if "path" in doc and doc["path"] is not None:
-            json_full_path = root_folder / doc["path"]
-            if json_full_path.exists() and json_full_path.is_file():
-                if not validate_gemini_json_structure(json_full_path):
-                    errors.append(
-                        ("path", "Gemini JSON file has invalid structure", doc_id)
-                    )
+        if path is not None and file_exists_in_tree(path, root_folder, all_files_set):
+            json_full_path = os.path.join(root_folder, path)
+            if not validate_gemini_json_structure(json_full_path):
+                errors.append(
+                    ("path", "Gemini JSON file has invalid structure", doc_id)
+                )
 
     # validate associated_video_lectures structure
-    if (
-        "associated_video_lectures" in doc
-        and doc["associated_video_lectures"] is not None
-    ):
-        if not isinstance(doc["associated_video_lectures"], list):
+    videos = doc.get("associated_video_lectures")
+    if videos is not None:
+        if not isinstance(videos, list):
             errors.append(("associated_video_lectures", "must be a list", doc_id))
         else:
-            for i, video in enumerate(doc["associated_video_lectures"]):
+            for i, video in enumerate(videos):
                 if not isinstance(video, dict):
                     errors.append(
                         (
@@ -397,64 +502,140 @@ def validate_document_fields(
                     )
                 else:
                     video_errors = validate_associated_video_lecture(
-                        video, doc_id, i, root_folder
+                        video, doc_id, i, root_folder, all_files_set
                     )
                     errors.extend(video_errors)
 
-    return errors
+                    # Collect associated video lecture paths
+                    for attr in PATH_ATTRIBUTES:
+                        value = video.get(attr)
+                        if value is not None:
+                            paths.append(
+                                (
+                                    f"associated_video_lectures[{i}].{attr}",
+                                    value,
+                                    doc_id,
+                                )
+                            )
+
+    return paths, errors
+
+
+# Result of validate_json_file, see its docstring
+JsonFileResult = Tuple[
+    "Counter[str]",
+    Dict[str, Set[str]],
+    List[Tuple[str, str, int]],
+    List[Tuple[str, str, int]],
+    List[Tuple[str, str, Union[int, str]]],
+    List[str],
+]
 
 
 def validate_json_file(
-    json_file: Path, root_folder: Path
-) -> Tuple[
-    List[Tuple[str, str, int]], List[Tuple[str, str, int]], List[Tuple[str, str, int]]
-]:
+    json_file: Path, root_folder: Path, all_files_set: Set[str]
+) -> JsonFileResult:
     """
     Validate all paths in a JSON file with exact case-sensitive checking.
-    Returns: (valid_paths, invalid_paths, field_errors) with (attribute_name, path_value/error_message, document_id)
+    all_files_set holds every non-hidden file under root_folder, as returned by
+    list_non_hidden_files, so most paths are checked without touching the
+    filesystem (see path_exists_in_tree).
+    The file is read once; the metadata summary is collected in the same pass
+    over the documents. Nothing is printed here: results are returned, so that
+    main can report them in file order whichever process runs the call, and
+    may be sent back from a worker, so they are plain builtins:
+    (from_date_counter, summary_sets, valid_paths, invalid_paths, field_errors,
+    warnings)
+    with summary_sets mapping each of SUMMARY_KEYS to the values seen,
+    (attribute_name, path_value/error_message, document_id) for the path and
+    field error lists, and the warning messages for the file.
+    Raises MetadataFileError if the file cannot be read or processed.
     """
-    valid_paths = []
-    invalid_paths = []
-    field_errors = []
+    per_file_date_counter: "Counter[str]" = Counter()
+    summary_sets: Dict[str, Set[str]] = {key: set() for key in SUMMARY_KEYS}
+    valid_paths: List[Tuple[str, str, int]] = []
+    invalid_paths: List[Tuple[str, str, int]] = []
+    # course_info errors use "course_info" in place of a document id
+    field_errors: List[Tuple[str, str, Union[int, str]]] = []
+    warnings: List[str] = []
 
     try:
-        with open(json_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        with open(json_file, "rb") as f:
+            data = _json_loads(f.read())
+
+        # check course_info.academic_course
+        ac_year = (
+            data.get("course_info", {}).get("academic_course")
+            if isinstance(data, dict)
+            else None
+        )
+        if ac_year != "2025-2026":
+            field_errors.append(
+                (
+                    "academic_course",
+                    f"must be '2025-2026', got: {ac_year}",
+                    "course_info",
+                )
+            )
 
         if "documents" not in data:
-            print(f"Warning: No 'documents' key found in {json_file}")
-            return valid_paths, invalid_paths, field_errors
-
-        for doc in data["documents"]:
-            # Validate document fields -
-            doc_field_errors = validate_document_fields(doc, root_folder)
-            field_errors.extend(doc_field_errors)
-
-            # Existing path validation
-            paths_to_check = extract_paths_from_document(doc)
-
-            for attr_name, path_value, doc_id in paths_to_check:
-                # Construct full path relative to root folder
-                full_path = root_folder / path_value
-                filename = full_path.name
-
-                folder_path_where_file_located = str(full_path.parent)
-                all_files_in_dir = os.listdir(folder_path_where_file_located)
-                if filename in all_files_in_dir:
-                    valid_paths.append((attr_name, path_value, doc_id))
-                else:
-                    invalid_paths.append((attr_name, path_value, doc_id))
+            warnings.append(f"Warning: No 'documents' key found in {json_file}")
+        else:
+            for doc in data["documents"]:
+                # collect sets for summary
+                for key in SUMMARY_KEYS:
+                    value = doc.get(key)
+                    if value is not None:
+                        summary_sets[key].add(value)
+                # count 'from' dates if present and well-formed
+                frm = doc.get("from")
+                if type(frm) is str and _is_ddmmyyyy(frm):
+                    per_file_date_counter[frm] += 1
+
+                # Validate document fields and collect its paths
+                doc_paths, doc_field_errors = process_document(
+                    doc, root_folder, all_files_set
+                )
+                field_errors.extend(doc_field_errors)
+
+                # Path validation
+                for attr_name, path_value, doc_id in doc_paths:
+                    if path_exists_in_tree(path_value, root_folder, all_files_set):
+                        valid_paths.append((attr_name, path_value, doc_id))
+                    else:
+                        invalid_paths.append((attr_name, path_value, doc_id))
 
     except json.JSONDecodeError as e:
-        print(f"Error: Invalid JSON in file {json_file}: {e}")
-        sys.exit(1)
+        raise MetadataFileError(f"Error: Invalid JSON in file {json_file}: {e}")
     except Exception as e:
-        print(f"Error processing file {json_file}: {e}")
-        sys.exit(1)
-    return valid_paths, invalid_paths, field_errors
+        raise MetadataFileError(f"Error processing file {json_file}: {e}")
+    return (
+        per_file_date_counter,
+        summary_sets,
+        valid_paths,
+        invalid_paths,
+        field_errors,
+        warnings,
+    )
+
+
+# Tree listing for _validate_json_file_task, set once per process by
+# _init_worker rather than sent along with every task
+_all_files_set: Set[str] = set()
+
 
+def _init_worker(all_files_set: Set[str]) -> None:
+    """Pool initializer: install the tree listing in this process."""
+    global _all_files_set
+    _all_files_set = all_files_set
 
-def main():
+
+def _validate_json_file_task(json_file: Path, root_folder: Path) -> JsonFileResult:
+    """validate_json_file against the listing installed by _init_worker."""
+    return validate_json_file(json_file, root_folder, _all_files_set)
+
+
+def main() -> None:
     parser = argparse.ArgumentParser(
         description="Validate file paths in JSON metadata files",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -464,7 +645,15 @@ def main():
         type=str,
         help="Path to the root folder of the RAG course, containing metadata and content directories",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes validating metadata files (default: one per file, up to the CPU count; 1 runs in-process)",
+    )
     args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
 
     root_folder = Path(args.root_folder)
 
@@ -477,120 +666,124 @@ def main():
     total_field_errors = 0
     all_invalid_paths = []
     all_field_errors = []
-    referenced_paths = set()
-    types_set = set()
-    subtypes_set = set()
-    models_set = set()
-    processing_methods_set = set()
+    referenced_paths: Set[str] = set()
+    summary_sets: Dict[str, Set[str]] = {key: set() for key in SUMMARY_KEYS}
 
-    metadata_dir = root_folder / "metadata"
-
-    for json_file in sorted(os.listdir(metadata_dir)):
-        if not json_file.endswith(".json"):
-            continue
+    # Walk the tree once: the same listing serves path validation and the
+    # unreferenced-files report. The metadata folder is not content, so it is
+    # left out of the walk altogether.
+    all_files = list_non_hidden_files(root_folder, exclude_dirs={"metadata"})
+    all_files_set = set(all_files)
 
-        json_file_path = metadata_dir / json_file
-
-        per_file_date_counter = Counter()
-        try:
-            with open(json_file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception:
-            data = None
+    metadata_dir = root_folder / "metadata"
+    json_files = [f for f in sorted(os.listdir(metadata_dir)) if f.endswith(".json")]
+    json_file_paths = [metadata_dir / json_file for json_file in json_files]
+
+    # Metadata files are independent of each other, so they are parsed and
+    # validated in parallel; map() yields the results in file order
+    workers = args.workers or os.cpu_count() or 1
+    # A pool starts all of its processes at once, so it never gets more
+    # workers than there are files
+    workers = max(1, min(len(json_file_paths), workers))
+    mapper: Callable[..., Iterator[Any]]
+    with ExitStack() as stack:
+        if workers == 1:
+            # no pool: keeps tracebacks and debuggers in this process
+            _init_worker(all_files_set)
+            mapper = map
         else:
-            # collect sets for summary (existing behavior)
-            for doc in data.get("documents", []):
-                if doc.get("type") is not None:
-                    types_set.add(doc["type"])
-                if doc.get("subtype") is not None:
-                    subtypes_set.add(doc["subtype"])
-                if doc.get("model") is not None:
-                    models_set.add(doc["model"])
-                if doc.get("processing_method") is not None:
-                    processing_methods_set.add(doc["processing_method"])
-                # count 'from' dates if present and well-formed
-                frm = doc.get("from")
-                if isinstance(frm, str) and _is_ddmmyyyy(frm):
-                    per_file_date_counter[frm] += 1
-
-            # check course_info.academic_course
-            ac_year = (
-                data.get("course_info", {}).get("academic_course")
-                if isinstance(data, dict)
-                else None
+            # the listing is sent to each worker once, not with every file
+            executor = ProcessPoolExecutor(
+                workers, initializer=_init_worker, initargs=(all_files_set,)
             )
-            if ac_year != "2025-2026":
+            # on an early exit, files not yet started are dropped rather than
+            # validated while the pool shuts down
+            stack.callback(executor.shutdown, cancel_futures=True)
+            mapper = executor.map
+        results = mapper(_validate_json_file_task, json_file_paths, repeat(root_folder))
+        for json_file, json_file_path in zip(json_files, json_file_paths):
+            print(f"Validating: {json_file_path}")
+            try:
+                (
+                    per_file_date_counter,
+                    file_summary_sets,
+                    valid_paths,
+                    invalid_paths,
+                    field_errors,
+                    warnings,
+                ) = next(results)
+            except MetadataFileError as e:
+                print(e)
+                sys.exit(1)
+
+            print("  'from' date occurrences:")
+            if per_file_date_counter:
+                for d, cnt in sorted(per_file_date_counter.items()):
+                    print(f"    {d}: {cnt}")
+            else:
+                print("    (none)")
+            for warning in warnings:
+                print(warning)
+
+            for key, values in file_summary_sets.items():
+                summary_sets[key] |= values
+
+            total_valid_paths += len(valid_paths)
+            total_invalid_paths += len(invalid_paths)
+            total_field_errors += len(field_errors)
+
+            for attr_name, path_value, doc_id in invalid_paths:
+                all_invalid_paths.append((json_file, doc_id, attr_name, path_value))
+
+            # Collect field errors
+            for field_name, error_message, error_doc_id in field_errors:
                 all_field_errors.append(
-                    (
-                        json_file,
-                        "course_info",
-                        "academic_course",
-                        f"must be '2025-2026', got: {ac_year}",
-                    )
+                    (json_file, error_doc_id, field_name, error_message)
                 )
-                total_field_errors += 1
-
-        print(f"Validating: {json_file_path}")
-        # Print per-file 'from' date counts BEFORE running deep validations (or after—either is fine)
-        print("  'from' date occurrences:")
-        if per_file_date_counter:
-            for d, cnt in sorted(per_file_date_counter.items()):
-                print(f"    {d}: {cnt}")
-        else:
-            print("    (none)")
-
-        valid_paths, invalid_paths, field_errors = validate_json_file(
-            json_file_path, root_folder
-        )
-
-        total_valid_paths += len(valid_paths)
-        total_invalid_paths += len(invalid_paths)
-        total_field_errors += len(field_errors)
-
-        for attr_name, path_value, doc_id in invalid_paths:
-            all_invalid_paths.append((json_file, doc_id, attr_name, path_value))
-
-        # Collect field errors
-        for field_name, error_message, doc_id in field_errors:
-            all_field_errors.append((json_file, doc_id, field_name, error_message))
 
-        # Record all referenced paths
-        for attr_name, path_value, doc_id in valid_paths + invalid_paths:
-            referenced_paths.add(path_value)
+            # Record all referenced paths
+            referenced_paths.update(path_value for _, path_value, _ in valid_paths)
+            referenced_paths.update(path_value for _, path_value, _ in invalid_paths)
 
     print(f"\nTotal paths checked: {total_valid_paths + total_invalid_paths}")
     print(f"Number of valid paths: {total_valid_paths}")
     print(f"Number of invalid paths: {total_invalid_paths}")
     print(f"Number of field validation errors: {total_field_errors}")
 
+    # Reports are built as lists of lines and printed with a single write
     if all_invalid_paths:
-        print("\nInvalid Paths:")
+        lines = ["\nInvalid Paths:"]
         for json_file, doc_id, attr_name, path_value in all_invalid_paths:
-            print(f"File: {json_file}")
-            print(f"  Document ID: {doc_id}")
-            print(f"  Attribute: {attr_name}")
-            print(f"  Path: {path_value}")
-            print()
+            lines.extend(
+                (
+                    f"File: {json_file}",
+                    f"  Document ID: {doc_id}",
+                    f"  Attribute: {attr_name}",
+                    f"  Path: {path_value}",
+                    "",
+                )
+            )
+        print("\n".join(lines))
     else:
         print("All paths seem valid")
 
     if all_field_errors:
-        print("\nField Validation Errors:")
-        for json_file, doc_id, field_name, error_message in all_field_errors:
-            print(f"File: {json_file}")
-            print(f"  Document ID: {doc_id}")
-            print(f"  Field: {field_name}")
-            print(f"  Error: {error_message}")
-            print()
+        lines = ["\nField Validation Errors:"]
+        for json_file, error_doc_id, field_name, error_message in all_field_errors:
+            lines.extend(
+                (
+                    f"File: {json_file}",
+                    f"  Document ID: {error_doc_id}",
+                    f"  Field: {field_name}",
+                    f"  Error: {error_message}",
+                    "",
+                )
+            )
+        print("\n".join(lines))
     else:
         print("All document fields are valid")
 
-    all_files = list_non_hidden_files(root_folder)
-
-    unreferenced = []
-    for f in all_files:
-        if f not in referenced_paths and not f.startswith("metadata/"):
-            unreferenced.append(f)
+    unreferenced = sorted(all_files_set - referenced_paths)
 
     print(f"\nTotal non-hidden files found: {len(all_files)}")
     print(
@@ -599,17 +792,19 @@ def main():
     print(f"Number of files *not* referenced: {len(unreferenced)}")
 
     if unreferenced:
-        print("\nUnreferenced Files:")
-        for f in sorted(unreferenced):
-            print(f"  {f}")
+        lines = ["\nUnreferenced Files:"]
+        lines.extend(f"  {f}" for f in unreferenced)
+        print("\n".join(lines))
     else:
         print("All non-hidden files are referenced in the metadata!")
 
     print("\nMetadata Summary:")
-    print(f"  Types: {', '.join(sorted(types_set))}")
-    print(f"  Subtypes: {', '.join(sorted(subtypes_set))}")
-    print(f"  Models: {', '.join(sorted(models_set))}")
-    print(f"  Processing methods: {', '.join(sorted(processing_methods_set))}")
+    print(f"  Types: {', '.join(sorted(summary_sets['type']))}")
+    print(f"  Subtypes: {', '.join(sorted(summary_sets['subtype']))}")
+    print(f"  Models: {', '.join(sorted(summary_sets['model']))}")
+    print(
+        f"  Processing methods: {', '.join(sorted(summary_sets['processing_method']))}"
+    )
 
 
 if __name__ == "__main__":